@@ -31,118 +31,254 @@ SOFTWARE.
 """
 import os
 import json
-from pathlib import Path
 import sys
-import subprocess
+import functools
 import re
+from dataclasses import dataclass
+
+# Optional JSON backends for Local State: orjson parses the whole file in C,
+# ijson streams only the profile subtree; both fall back to the json module
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+try:
+    import ijson
+    _JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _JSON_ERRORS = (json.JSONDecodeError,)
+
+# Default Brave profile and user launcher locations
+_HOME = os.path.expanduser("~")
+_BRAVE_CFG = os.path.join(_HOME, ".config", "BraveSoftware", "Brave-Browser")
+_LOCAL_STATE = os.path.join(_BRAVE_CFG, "Local State")
+_DESKTOP_DIR = os.path.join(_HOME, ".local", "share", "applications")
+
+# Desktop entry written for each profile launcher
+_DESKTOP_TMPL = """[Desktop Entry]
+Version=1.0
+Type=Application
+Name={title}
+Comment=Access {name} profile in Brave
+Exec={exe} --profile-directory="{pid}"
+Icon=brave-browser
+Terminal=false
+StartupNotify=true
+Categories=Network;WebBrowser;
+"""
+
+# Case-insensitive probe for Brave mentions that doesn't allocate a lowercased copy
+_BRAVE_RE = re.compile('brave', re.IGNORECASE)
+
+# Well-known launchers installed by Brave itself, skipped without being read.
+# This is only a shortcut; the content check still decides what is a profile launcher
+_EXCLUDE_FILENAMES = frozenset((
+    "brave-browser.desktop",
+    "brave.desktop",
+    "brave-browser-stable.desktop",
+    "brave-browser-beta.desktop",
+    "brave-browser-dev.desktop",
+    "brave-browser-nightly.desktop",
+))
+
+# Filenames of launchers created by this script: brave-{safe_name}-{safe_id}.desktop
+_SCRIPT_FILE_RE = re.compile(r'^brave-(.+)-([^-]+)\.desktop$')
+
+# Number of characters read from the top of a .desktop file when parsing it
+_DESKTOP_HEADER_SIZE = 4096
+
+# Minimum number of candidate launchers before they are parsed in parallel
+_PARALLEL_SCAN_MIN = 8
+
+# In-memory caches keyed by the mtime of the file/directory they were built from
+_profiles_cache = {'mtime': None, 'data': None}
+_launchers_cache = {'mtime': None, 'data': None}
 
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if os.name == 'nt':
+        # Legacy Windows consoles may not understand ANSI escape sequences
+        os.system('cls')
+        return
+    
+    # Move the cursor home and clear the screen without spawning a shell
+    sys.stdout.write('\x1b[H\x1b[2J')
+    sys.stdout.flush()
 
 def find_brave_profiles():
     """Find and return all Brave browser profiles with their IDs and names."""
     
-    # Default Brave browser profile location
-    brave_path = Path.home() / ".config" / "BraveSoftware" / "Brave-Browser"
-    
-    # Check if the Brave directory exists
-    if not brave_path.exists():
-        print(f"Brave browser profile directory not found at: {brave_path}")
-        print("Please make sure Brave browser is installed and has been run at least once.")
-        return []
-    
     # Look for Local State file which contains profile information
-    local_state_path = brave_path / "Local State"
-    if not local_state_path.exists():
-        print(f"Brave browser Local State file not found at: {local_state_path}")
+    try:
+        mtime = os.stat(_LOCAL_STATE).st_mtime_ns
+    except OSError:
+        # Check if the Brave directory exists
+        if not os.path.exists(_BRAVE_CFG):
+            print(f"Brave browser profile directory not found at: {_BRAVE_CFG}")
+            print("Please make sure Brave browser is installed and has been run at least once.")
+        else:
+            print(f"Brave browser Local State file not found at: {_LOCAL_STATE}")
         return []
     
+    # Reuse the previous result if Local State hasn't changed since
+    if _profiles_cache['mtime'] == mtime:
+        return list(_profiles_cache['data'])
+    
     # Read and parse the Local State file
     try:
-        with open(local_state_path, 'r', encoding='utf-8') as file:
-            local_state = json.load(file)
-    except (json.JSONDecodeError, UnicodeDecodeError, IOError) as e:
+        if orjson is None and ijson is not None:
+            # Stream just profile.info_cache instead of loading the whole file
+            with open(_LOCAL_STATE, 'rb') as file:
+                info_cache = dict(ijson.kvitems(file, 'profile.info_cache'))
+        else:
+            # Parse the whole file from a single bytes buffer
+            with open(_LOCAL_STATE, 'rb') as file:
+                local_state = _json_loads(file.read())
+            profile = local_state.get('profile') if isinstance(local_state, dict) else None
+            info_cache = profile.get('info_cache') if isinstance(profile, dict) else None
+    except _JSON_ERRORS + (UnicodeDecodeError, IOError) as e:
         print(f"Error reading Brave browser Local State file: {e}")
         return []
     
-    # Extract profile information
+    # Extract profile information, tolerating unexpected shapes in Local State
     profiles = []
-    if 'profile' in local_state and 'info_cache' in local_state['profile']:
-        for profile_id, profile_info in local_state['profile']['info_cache'].items():
-            name = profile_info.get('name', 'Unknown')
+    if isinstance(info_cache, dict):
+        for profile_id, profile_info in info_cache.items():
+            name = profile_info.get('name', 'Unknown') if isinstance(profile_info, dict) else 'Unknown'
             profiles.append((profile_id, name))
     
-    return profiles
+    _profiles_cache['mtime'] = mtime
+    _profiles_cache['data'] = profiles
+    return list(profiles)
+
+def _parse_profile_directory(exec_line):
+    """Return the --profile-directory value from an Exec line, or None if absent."""
+    _, found, value = exec_line.partition("--profile-directory=")
+    if not found or not value:
+        return None
+    
+    # Quoted values may contain spaces (e.g. "Profile 1")
+    if value[0] in "\"'":
+        return value[1:].split(value[0], 1)[0]
+    return value.split(None, 1)[0]
+
+def _parse_one_desktop(desktop_path):
+    """Return launcher info for a Brave profile desktop file, or None if it isn't one."""
+    filename = os.path.basename(desktop_path)
+    
+    # Only the header is needed; Name and Exec sit at the top of [Desktop Entry]
+    try:
+        with open(desktop_path, 'r', encoding='utf-8') as file:
+            header = file.read(_DESKTOP_HEADER_SIZE)
+    except Exception:
+        # Skip files we can't read correctly
+        return None
+    
+    # Scan the header once, picking up Name and Exec from the
+    # [Desktop Entry] section and noting any mention of Brave
+    has_brave = False
+    in_entry = False
+    full_name = exec_line = None
+    for line in header.splitlines():
+        if not has_brave and _BRAVE_RE.search(line):
+            has_brave = True
+        if line.startswith("["):
+            in_entry = line.strip() == "[Desktop Entry]"
+        elif in_entry:
+            if full_name is None and line.startswith("Name="):
+                full_name = line[5:].strip()
+            elif exec_line is None and line.startswith("Exec="):
+                exec_line = line[5:].strip()
+                # Not a profile launcher; no need to look any further
+                if "--profile-directory" not in exec_line:
+                    return None
+        if has_brave and full_name is not None and exec_line is not None:
+            break
+    
+    # Check if it's a Brave profile launcher (Exec uses --profile-directory)
+    if not has_brave or not exec_line or "--profile-directory" not in exec_line:
+        return None
+    
+    # Extract profile ID from command line
+    profile_id = _parse_profile_directory(exec_line) or "default"
+    
+    # Extract profile name from Name field
+    profile_name = "Unknown"
+    if full_name:
+        if " - " in full_name and full_name.lower().startswith("brave"):
+            profile_name = full_name.split(" - ", 1)[1]
+        else:
+            profile_name = full_name
+    
+    return {
+        'filename': filename,
+        'path': desktop_path,
+        'profile_name': profile_name,
+        'profile_id': profile_id,
+        # Check if it was created by our script (filename pattern)
+        'created_by_script': bool(_SCRIPT_FILE_RE.match(filename)),
+        'is_system': False  # Never system files since we only look at ~/.local
+    }
 
 def find_brave_profile_launchers():
     """Find all Brave profile desktop files in the user's applications directory."""
     
-    # Only look in the user's applications directory
-    desktop_dir = Path.home() / ".local" / "share" / "applications"
-    
-    # Check if the directory exists
-    if not desktop_dir.exists():
-        print(f"Applications directory not found at: {desktop_dir}")
+    # Only look in the user's applications directory; check that it exists
+    try:
+        mtime = os.stat(_DESKTOP_DIR).st_mtime_ns
+    except OSError:
+        print(f"Applications directory not found at: {_DESKTOP_DIR}")
         return []
     
-    # Look for Brave profile desktop files
-    brave_desktop_files = []
+    # Reuse the previous scan if no launcher was added or removed since
+    if _launchers_cache['mtime'] == mtime:
+        return [dict(file_info) for file_info in _launchers_cache['data']]
     
-    # Examine all desktop files
-    for desktop_path in desktop_dir.glob("*.desktop"):
-        filename = desktop_path.name
-        
-        # Check the content to see if it's a Brave profile launcher
-        try:
-            with open(desktop_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-                
-                # Check if it's a Brave-related file
-                if "brave" not in content.lower():
+    # Collect candidate desktop files, skipping those that don't mention
+    # Brave in their name before reading them
+    desktop_paths = []
+    try:
+        with os.scandir(_DESKTOP_DIR) as entries:
+            for entry in entries:
+                filename = entry.name
+                if not filename.endswith(".desktop") or "brave" not in filename.lower():
                     continue
-                
-                # Check if it's a profile launcher (contains --profile-directory)
-                if "--profile-directory" not in content:
+            
+                # Don't bother reading Brave's own well-known browser launchers
+                if filename.lower() in _EXCLUDE_FILENAMES:
                     continue
-                
-                # Extract profile ID from command line
-                profile_id = "default"
-                cmd_match = re.search(r'--profile-directory=["\']?(.*?)["\']?(\s|$)', content)
-                if cmd_match:
-                    profile_id = cmd_match.group(1)
-                
-                # Extract profile name from Name field
-                profile_name = "Unknown"
-                name_match = re.search(r'Name=(.*?)(\n|$)', content)
-                if name_match:
-                    full_name = name_match.group(1).strip()
-                    if " - " in full_name and full_name.lower().startswith("brave"):
-                        profile_name = full_name.split(" - ", 1)[1]
-                    else:
-                        profile_name = full_name
-                
-                # Check if it was created by our script (filename pattern)
-                created_by_script = filename.startswith("brave-")
-                
-                brave_desktop_files.append({
-                    'filename': filename,
-                    'path': desktop_path,
-                    'profile_name': profile_name,
-                    'profile_id': profile_id,
-                    'created_by_script': created_by_script,
-                    'is_system': False  # Never system files since we only look at ~/.local
-                })
-        except Exception:
-            # Skip files we can't parse correctly
-            continue
-    
-    return brave_desktop_files
-
-def create_desktop_file(profile_id, profile_name, custom_title=None):
-    """Create a Gnome desktop file for the specified Brave profile."""
+            
+                # Only stat entries whose name already qualifies
+                if not entry.is_file():
+                    continue
+            
+                desktop_paths.append(entry.path)
+    except OSError:
+        # Not a readable directory (e.g. a plain file or missing permissions)
+        print(f"Applications directory not found at: {_DESKTOP_DIR}")
+        return []
     
-    # Find the path to the Brave executable
+    # Parse the candidates, fanning out to threads when there are enough of them
+    # for the overlapping I/O to outweigh the cost of starting the pool
+    if len(desktop_paths) < _PARALLEL_SCAN_MIN:
+        results = [_parse_one_desktop(path) for path in desktop_paths]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(32, len(desktop_paths))) as executor:
+            results = list(executor.map(_parse_one_desktop, desktop_paths))
+    brave_desktop_files = [file_info for file_info in results if file_info is not None]
+    
+    _launchers_cache['mtime'] = mtime
+    _launchers_cache['data'] = brave_desktop_files
+    return [dict(file_info) for file_info in brave_desktop_files]
+
+@functools.lru_cache(maxsize=1)
+def _find_brave_executable():
+    """Locate the Brave executable, returning an empty string if it can't be found."""
     brave_path = ""
     possible_paths = [
         "/usr/bin/brave-browser",
@@ -152,88 +288,107 @@ def create_desktop_file(profile_id, profile_name, custom_title=None):
     ]
     
     for path in possible_paths:
-        if os.path.exists(path):
+        if os.access(path, os.X_OK):
             brave_path = path
             break
     
     if not brave_path:
-        try:
-            # Try to find brave using which command
-            result = subprocess.run(['which', 'brave-browser'], capture_output=True, text=True)
-            if result.returncode == 0 and result.stdout.strip():
-                brave_path = result.stdout.strip()
-            else:
-                result = subprocess.run(['which', 'brave'], capture_output=True, text=True)
-                if result.returncode == 0 and result.stdout.strip():
-                    brave_path = result.stdout.strip()
-        except Exception:
-            pass
+        # Fall back to searching PATH; only needed on this path, so imported lazily
+        import shutil
+        brave_path = shutil.which('brave-browser') or shutil.which('brave') or ""
+    
+    return brave_path
+
+def _safe_id(profile_id):
+    """Return a profile ID with spaces and slashes replaced by underscores."""
+    return str(profile_id).replace(" ", "_").replace("/", "_")
+
+def _safe_name(profile_name):
+    """Return the lowercased, filename-safe form of a profile name."""
+    return _safe_id(profile_name).lower()
+
+@dataclass(frozen=True)
+class BraveCtx:
+    """Brave executable and launcher directory shared by a batch of launchers."""
+    brave_path: str
+    desktop_dir: str
+
+def make_brave_ctx():
+    """Resolve the Brave executable and create the launcher directory, or return None on error."""
+    
+    # Find the path to the Brave executable
+    brave_path = _find_brave_executable()
     
     if not brave_path:
         print("Error: Could not find Brave browser executable.")
         print("Please enter the path to the Brave browser executable:")
         brave_path = input("> ").strip()
-        if not brave_path or not os.path.exists(brave_path):
+        if not brave_path or not os.access(brave_path, os.X_OK):
             print("Invalid path. Desktop file not created.")
-            return False
+            return None
     
     # Create the desktop directory if it doesn't exist
-    desktop_dir = Path.home() / ".local" / "share" / "applications"
-    desktop_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Generate a safe filename - replace spaces and slashes with underscores in both profile name and ID
-    safe_name = profile_name.replace(" ", "_").replace("/", "_").lower()
-    safe_id = str(profile_id).replace(" ", "_").replace("/", "_")
-    desktop_filename = f"brave-{safe_name}-{safe_id}.desktop"
-    desktop_path = desktop_dir / desktop_filename
+    os.makedirs(_DESKTOP_DIR, exist_ok=True)
+    return BraveCtx(brave_path, _DESKTOP_DIR)
+
+def build_desktop_file(ctx, profile_id, profile_name, custom_title=None):
+    """Return the (path, content) of the desktop file for a profile."""
     
-    # Use the brave executable directly with the profile directory parameter
-    exec_command = f"{brave_path} --profile-directory=\"{profile_id}\""
+    # Generate a safe filename from the profile name and ID
+    desktop_filename = f"brave-{_safe_name(profile_name)}-{_safe_id(profile_id)}.desktop"
+    desktop_path = os.path.join(ctx.desktop_dir, desktop_filename)
     
     # Use custom title if provided, otherwise use default format
     title = custom_title if custom_title else f"Brave - {profile_name}"
     
-    # Create the desktop file content
-    desktop_content = f"""[Desktop Entry]
-Version=1.0
-Type=Application
-Name={title}
-Comment=Access {profile_name} profile in Brave
-Exec={exec_command}
-Icon=brave-browser
-Terminal=false
-StartupNotify=true
-Categories=Network;WebBrowser;
-"""
+    # Fill in the desktop file template, launching the brave executable
+    # directly with the profile directory parameter
+    desktop_content = _DESKTOP_TMPL.format(title=title, name=profile_name, exe=ctx.brave_path, pid=profile_id)
     
-    # Write the desktop file
+    return desktop_path, desktop_content
+
+def write_desktop_file(desktop_path, desktop_content):
+    """Write an executable desktop file."""
     try:
-        with open(desktop_path, 'w') as file:
-            file.write(desktop_content)
+        fd = os.open(desktop_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+        try:
+            # os.write may write fewer bytes than asked, so keep going until done
+            data = memoryview(desktop_content.encode('utf-8'))
+            while data:
+                data = data[os.write(fd, data):]
+            # Make the desktop file executable regardless of umask or an older mode
+            os.fchmod(fd, 0o755)
+        finally:
+            os.close(fd)
         
-        # Make the desktop file executable
-        os.chmod(desktop_path, 0o755)
+        _launchers_cache['mtime'] = None
         print(f"Desktop file created: {desktop_path}")
         return True
     except Exception as e:
         print(f"Error creating desktop file: {e}")
         return False
 
-def remove_desktop_file(desktop_file_info):
-    """Remove a desktop file."""
+def create_desktop_file(ctx, profile_id, profile_name, custom_title=None):
+    """Create a Gnome desktop file for the specified Brave profile."""
+    return write_desktop_file(*build_desktop_file(ctx, profile_id, profile_name, custom_title))
+
+def remove_desktop_file(desktop_file_info, messages=None):
+    """Remove a desktop file, collecting status lines in messages instead of printing if given."""
+    report = print if messages is None else messages.append
     try:
         # Check if we can remove the file
         if desktop_file_info['is_system']:
-            print(f"Warning: Cannot remove system file: {desktop_file_info['path']}")
-            print("You would need sudo privileges to remove this file.")
+            report(f"Warning: Cannot remove system file: {desktop_file_info['path']}")
+            report("You would need sudo privileges to remove this file.")
             return False
             
         # Remove the desktop file
-        desktop_file_info['path'].unlink()
-        print(f"Removed desktop file: {desktop_file_info['path']}")
+        os.unlink(desktop_file_info['path'])
+        _launchers_cache['mtime'] = None
+        report(f"Removed desktop file: {desktop_file_info['path']}")
         return True
     except Exception as e:
-        print(f"Error removing desktop file: {e}")
+        report(f"Error removing desktop file: {e}")
         return False
 
 def wait_for_input():
@@ -286,10 +441,17 @@ def create_launcher():
     choice = input("> ").strip()
     
     if choice.lower() == 'a':
+        # Resolve Brave and the launcher directory once for the whole batch
+        ctx = make_brave_ctx()
+        if ctx is None:
+            wait_for_input()
+            return
+        
         # Ask if user wants custom titles
         use_custom_titles = input("\nDo you want to customize launcher titles? (y/n): ").strip().lower() == 'y'
         
-        # Create desktop files for all profiles
+        # Build desktop files for all profiles, then write them in one go
+        desktop_files = []
         for profile_id, name in profiles:
             custom_title = None
             if use_custom_titles:
@@ -298,7 +460,10 @@ def create_launcher():
                 if not custom_title:
                     custom_title = None  # Use default if empty
             
-            create_desktop_file(profile_id, name, custom_title)
+            desktop_files.append(build_desktop_file(ctx, profile_id, name, custom_title))
+        
+        for desktop_path, desktop_content in desktop_files:
+            write_desktop_file(desktop_path, desktop_content)
             
         print("\nDesktop shortcuts created for all profiles.")
         print("You may need to restart the shell or log out and back in for them to appear in the application menu.")
@@ -314,7 +479,8 @@ def create_launcher():
                 if not custom_title:
                     custom_title = None  # Use default if empty
                 
-                if create_desktop_file(profile_id, name, custom_title):
+                ctx = make_brave_ctx()
+                if ctx is not None and create_desktop_file(ctx, profile_id, name, custom_title):
                     print(f"\nDesktop shortcut created for '{name}' profile.")
                     print("You may need to restart the shell or log out and back in for it to appear in the application menu.")
             else:
@@ -324,6 +490,54 @@ def create_launcher():
     
     wait_for_input()
 
+def remove_selected_launcher(desktop_files):
+    """Ask for one of the listed launchers and remove it."""
+    profile_idx = input("\nEnter the number of the profile launcher to remove: ").strip()
+    try:
+        idx = int(profile_idx) - 1
+        if 0 <= idx < len(desktop_files):
+            file_info = desktop_files[idx]
+            if file_info['is_system']:
+                print("\nThis is a system-wide launcher and requires sudo privileges to remove.")
+                print("You can manually remove it with:")
+                print(f"  sudo rm '{file_info['path']}'")
+            else:
+                if remove_desktop_file(file_info):
+                    print(f"\nSuccessfully removed launcher for '{file_info['profile_name']}' profile.")
+        else:
+            print("Invalid selection. No changes made.")
+    except ValueError:
+        print("Invalid input. No changes made.")
+
+def remove_script_launchers(desktop_files):
+    """Remove all listed launchers that were created by this script, after confirmation."""
+    confirm = input("\nAre you sure you want to remove ALL Brave profile launchers created by this script? (y/n): ").strip().lower()
+    if confirm != 'y':
+        print("Operation cancelled. No changes made.")
+        return
+    
+    removed_count = 0
+    script_created_files = [f for f in desktop_files if f['created_by_script'] and not f['is_system']]
+    
+    if not script_created_files:
+        print("No launchers created by this script were found.")
+        return
+        
+    # Remove everything first and report in one write to the terminal
+    messages = []
+    for file_info in script_created_files:
+        if remove_desktop_file(file_info, messages):
+            removed_count += 1
+    
+    messages.append(f"\nRemoved {removed_count} of {len(script_created_files)} Brave profile launchers.")
+    print("\n".join(messages))
+
+# Manage-launchers choices mapped to their handlers ("3" returns to the main menu)
+_MANAGE_MENU = {
+    '1': remove_selected_launcher,
+    '2': remove_script_launchers,
+}
+
 def manage_launchers():
     """Manage existing profile launchers."""
     clear_screen()
@@ -352,48 +566,23 @@ def manage_launchers():
     
     choice = input("\nEnter your choice (1-3): ").strip()
     
-    if choice == '1':
-        profile_idx = input("\nEnter the number of the profile launcher to remove: ").strip()
-        try:
-            idx = int(profile_idx) - 1
-            if 0 <= idx < len(desktop_files):
-                file_info = desktop_files[idx]
-                if file_info['is_system']:
-                    print("\nThis is a system-wide launcher and requires sudo privileges to remove.")
-                    print("You can manually remove it with:")
-                    print(f"  sudo rm '{file_info['path']}'")
-                else:
-                    if remove_desktop_file(file_info):
-                        print(f"\nSuccessfully removed launcher for '{file_info['profile_name']}' profile.")
-            else:
-                print("Invalid selection. No changes made.")
-        except ValueError:
-            print("Invalid input. No changes made.")
-    
-    elif choice == '2':
-        confirm = input("\nAre you sure you want to remove ALL Brave profile launchers created by this script? (y/n): ").strip().lower()
-        if confirm == 'y':
-            removed_count = 0
-            script_created_files = [f for f in desktop_files if f['created_by_script'] and not f['is_system']]
-            
-            if not script_created_files:
-                print("No launchers created by this script were found.")
-                wait_for_input()
-                return
-                
-            for file_info in script_created_files:
-                if remove_desktop_file(file_info):
-                    removed_count += 1
-            print(f"\nRemoved {removed_count} of {len(script_created_files)} Brave profile launchers.")
-        else:
-            print("Operation cancelled. No changes made.")
-    
-    elif choice == '3':
+    if choice == '3':
         # Return directly to main menu without waiting for input
         return
     
+    action = _MANAGE_MENU.get(choice)
+    if action:
+        action(desktop_files)
+    
     wait_for_input()
 
+# Main menu choices mapped to their handlers ("4" exits)
+_MAIN_MENU = {
+    "1": manage_launchers,
+    "2": create_launcher,
+    "3": list_profiles,
+}
+
 def display_main_menu():
     """Display the main menu and handle user input."""
     while True:
@@ -406,12 +595,9 @@ def display_main_menu():
         
         choice = input("\nEnter your choice (1-4): ").strip()
         
-        if choice == "1":
-            manage_launchers()
-        elif choice == "2":
-            create_launcher()
-        elif choice == "3":
-            list_profiles()
+        action = _MAIN_MENU.get(choice)
+        if action:
+            action()
         elif choice == "4":
             print("Exiting...")
             sys.exit(0)